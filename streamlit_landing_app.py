@@ -11,6 +11,7 @@
 #   - requirements.txt:
 #       streamlit>=1.35
 #       requests>=2.31
+#       orjson (opzionale, serializzazione JSON più veloce)
 #   - Secrets (opzionali):
 #       FORMSPREE_ENDPOINT="https://formspree.io/f/xxxxabcd"
 #       oppure SMTP: EMAIL_HOST, EMAIL_PORT, EMAIL_USER, EMAIL_PASS, EMAIL_TO
@@ -24,14 +25,38 @@
 from __future__ import annotations
 import re
 import json
+from html import escape
 import importlib
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
+from operator import itemgetter
+from urllib.parse import quote, urlencode
 
-# requests è usato in modalità Streamlit per inviare la form (Formspree/HTTP)
+# requests è usato solo in modalità Streamlit (invio form Formspree/HTTP):
+# viene importato pigramente al primo uso, così la CLI e il cold start non lo pagano.
+_rq = None
+
+
+def _requests():
+    """Restituisce il modulo `requests` (import pigro, una volta sola) o None se assente."""
+    global _rq
+    if _rq is None:
+        try:
+            import requests as _rq  # type: ignore
+        except Exception:  # in CLI i test non ne hanno bisogno
+            _rq = False  # fallback safe: non ritentare l'import
+    return _rq or None
+
+
+# Serializzazione JSON del payload form: orjson (estensione C) se installato, altrimenti json
 try:
-    import requests  # type: ignore
-except Exception:  # in CLI i test non ne hanno bisogno
-    requests = None  # fallback safe
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+except Exception:  # opzionale
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+_JSON_HDRS = {"Content-Type": "application/json"}
 
 # ---------------------- CONFIGURAZIONE RAPIDA ----------------------
 COMPANY_NAME = "Il Nodo del Vento"
@@ -47,41 +72,224 @@ PHOTOS = [
 ]
 # -------------------------------------------------------------------
 
+# Oggetto delle richieste (Formspree `_subject` e SMTP)
+_SUBJECT = f"Richiesta preventivo – {COMPANY_NAME}"
+
+# Secrets richiesti per il fallback SMTP
+_SMTP_KEYS = frozenset(("EMAIL_HOST", "EMAIL_PORT", "EMAIL_USER", "EMAIL_PASS", "EMAIL_TO"))
+
+# ---- Stili leggeri (HTML costante, costruito una volta per esecuzione dello script) ----
+_CSS = """
+<style>
+.stButton>button {border-radius:14px;padding:10px 16px}
+.card {background: rgba(255,255,255,0.05); border:1px solid rgba(255,255,255,0.12); padding:18px; border-radius:16px}
+.muted {color: rgba(255,255,255,0.7)}
+.small {font-size: 0.9rem}
+.hidden-field {display:none;}
+.gallery {display:grid; grid-template-columns:repeat(4, 1fr); gap:16px}
+.gallery figure {margin:0}
+.gallery img {width:100%; height:auto; border-radius:12px}
+.gallery figcaption {text-align:center; font-size:0.9rem; color: rgba(255,255,255,0.7)}
+@media (max-width: 640px) {.gallery {grid-template-columns:repeat(2, 1fr)}}
+</style>
+"""
+
 # ---- Utility di validazione ----
-EMAIL_RE = re.compile(r"^[\w\-.]+@([\w-]+\.)+[\w-]{2,}$")
-PHONE_RE = re.compile(r"^[0-9 +()\-]{7,}$")
+# Dominio scritto con un solo modo di suddividere le etichette (niente gruppo ripetuto
+# con punto finale): il match resta lineare anche su input ostili tipo "a@" + "a." * n
+EMAIL_PAT = r"^[\w\-.]+@[\w-]+(?:\.[\w-]+)*\.[\w-]{2,}$"
+PHONE_PAT = r"^[0-9 +()\-]{7,}$"
+
+# Streamlit riesegue lo script da capo a ogni interazione: i pattern compilati
+# vengono installati qui da `st.cache_resource` (vedi run_streamlit_app), così
+# restano gli stessi oggetti per tutta la vita del processo server.
+_pattern_cache: tuple[re.Pattern, re.Pattern] | None = None
+
+def _compile_patterns() -> tuple[re.Pattern, re.Pattern]:
+    # re.ASCII: \w e le classi non consultano le tabelle Unicode (input atteso ASCII)
+    return re.compile(EMAIL_PAT, re.ASCII), re.compile(PHONE_PAT, re.ASCII)
+
+def _patterns() -> tuple[re.Pattern, re.Pattern]:
+    global _pattern_cache
+    if _pattern_cache is None:
+        _pattern_cache = _compile_patterns()
+    return _pattern_cache
 
 def is_valid_email(s: str) -> bool:
-    return bool(EMAIL_RE.match(s or ""))
+    return bool(_patterns()[0].match(s or ""))
 
 def is_valid_phone(s: str) -> bool:
-    return bool(PHONE_RE.match(s or ""))
+    return bool(_patterns()[1].match(s or ""))
+
+# ---- Test di validazione (condivisi tra expander Streamlit e CLI) ----
+# Costante di modulo: le coppie (nome, check) sono costruite una volta per esecuzione
+# dello script (Streamlit riesegue il modulo a ogni rerun), non a ogni chiamata.
+_TEST_CASES = (
+    ("email valida semplice", lambda: is_valid_email("mario.rossi@mail.it")),
+    ("email senza dominio", lambda: not is_valid_email("mario@")),
+    ("email dominio corto", lambda: not is_valid_email("mario@mail")),
+    ("telefono valido IT", lambda: is_valid_phone("+39 333 123 4567")),
+    ("telefono troppo corto", lambda: not is_valid_phone("123")),
+    ("email con subdominio", lambda: is_valid_email("mario@sub.mail.it")),
+    ("telefono con parentesi", lambda: is_valid_phone("(333) 123-4567")),
+)
+
+
+def validate_lite(f: dict, today: date | None = None) -> dict:
+    """Versione ridotta della validazione form: restituisce i campi in errore."""
+    today = today or date.today()
+    e = {}
+    if not f.get("name") or len(f["name"].strip()) < 2:
+        e["name"] = 1
+    if not is_valid_email(f.get("email", "")):
+        e["email"] = 1
+    if not is_valid_phone(f.get("phone", "")):
+        e["phone"] = 1
+    if not f.get("date"):
+        e["date"] = 1
+    else:
+        # Non accettare date nel passato
+        try:
+            if f["date"] < today:
+                e["date"] = 1
+        except Exception:
+            e["date"] = 1
+    if not f.get("consent"):
+        e["consent"] = 1
+    return e
+
+
+def _run_tests() -> list[tuple[str, bool]]:
+    """Esegue tutti i test di validazione e restituisce le coppie (nome, esito)."""
+    today = date.today()
+    tomorrow = today + timedelta(days=1)
+    yesterday = today - timedelta(days=1)
+
+    form_ok = {
+        "name": "Mario Rossi",
+        "email": "ok@mail.it",
+        "phone": "+39 333 123 4567",
+        "date": tomorrow,
+        "consent": True,
+    }
+    form_no_consent = {**form_ok, "consent": False}
+    form_past = {**form_ok, "date": yesterday}
+    form_short_name = {**form_ok, "name": "M"}
+
+    return [
+        *((n, f()) for n, f in _TEST_CASES),
+        ("form valido futuro", len(validate_lite(form_ok, today)) == 0),
+        ("form consenso mancante", "consent" in validate_lite(form_no_consent, today)),
+        ("form data passata", "date" in validate_lite(form_past, today)),
+        ("form nome troppo corto", "name" in validate_lite(form_short_name, today)),
+    ]
+
 
 # ------------------------------------------------------------
 # Modalità STREAMLIT: definita in funzione per evitare import a livello modulo
 # ------------------------------------------------------------
 
+def _make_session():
+    """Sessione HTTP condivisa (keep-alive) per Formspree, o None senza requests."""
+    requests = _requests()
+    if requests is None:
+        return None
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "landing/1.0"
+    return session
+
+
+def _make_mail_executor():
+    """Pool di thread per l'invio SMTP, fuori dal rerun di Streamlit."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="mail")
+
+
+def _send_smtp(payload: dict, cfg: dict) -> None:
+    """Invia la richiesta via SMTP_SSL. `cfg` contiene i secrets EMAIL_* già letti."""
+    import smtplib
+    from email.mime.text import MIMEText
+
+    body = (
+        f"Data evento: {payload['evento_data']}\n"
+        f"Nome: {payload['nome']}\n"
+        f"Telefono: {payload['telefono']}\n"
+        f"Email: {payload['email']}\n"
+        f"Luogo: {payload['location']}\n"
+        f"Messaggio: {payload['messaggio']}\n"
+    )
+    msg = MIMEText(body, _charset="utf-8")
+    msg["Subject"] = _SUBJECT
+    msg["From"] = cfg["EMAIL_USER"]
+    msg["To"] = cfg["EMAIL_TO"]
+
+    # timeout esplicito: un server bloccato non deve occupare per sempre un worker del pool
+    with smtplib.SMTP_SSL(cfg["EMAIL_HOST"], int(cfg["EMAIL_PORT"]), timeout=10) as server:
+        server.login(cfg["EMAIL_USER"], cfg["EMAIL_PASS"])
+        server.sendmail(msg["From"], [msg["To"]], msg.as_string())
+
+
+def _mailto_link(payload: dict) -> str:
+    """Link mailto precompilato con i dati della richiesta (fallback manuale)."""
+    body_text = (
+        f"Ciao,\r\nvorrei prenotare lo spettacolo {COMPANY_NAME}.\r\n"
+        f"Data evento: {payload['evento_data']}\r\n"
+        f"Nome: {payload['nome']}\r\n"
+        f"Telefono: {payload['telefono']}\r\n"
+        f"Email: {payload['email']}\r\n"
+        f"Luogo: {payload['location']}\r\n"
+        f"Messaggio: {payload['messaggio']}"
+    )
+    qs = urlencode(
+        {"subject": f"Richiesta {COMPANY_NAME}", "body": body_text},
+        quote_via=quote,
+    )
+    return f"mailto:{CONTACT_EMAIL}?{qs}"
+
+
+def _bootstrap() -> dict:
+    """Setup una-tantum della landing (pattern, contatti, galleria).
+
+    In Streamlit viene memoizzato con `st.cache_resource`: gira una volta per
+    processo server invece che a ogni rerun.
+    """
+    return {
+        "patterns": _compile_patterns(),
+        "contacts_md": f"""
+            **Email:** [{CONTACT_EMAIL}](mailto:{CONTACT_EMAIL})  
+            **Telefono:** [{CONTACT_PHONE}](tel:{CONTACT_PHONE})  
+            **WhatsApp:** [Scrivici](https://wa.me/{WHATSAPP_PHONE})
+            """,
+        # Galleria in un unico blocco HTML: un solo messaggio verso il front-end,
+        # lazy-loading delle immagini lasciato al browser
+        "gallery_html": "<div class='gallery'>" + "".join(
+            f"<figure><img src=\"{escape(src)}\" alt=\"Foto {i}\" loading=\"lazy\">"
+            f"<figcaption>Foto {i}</figcaption></figure>"
+            for i, src in enumerate(PHOTOS[:4], start=1)
+        ) + "</div>",
+    }
+
+
 def run_streamlit_app(st):
     """Esegue la landing completa in Streamlit."""
+    global _pattern_cache
+    # set_page_config deve essere il primo comando Streamlit; le cache non
+    # mostrano lo spinner (che emetterebbe un elemento prima della page config).
     st.set_page_config(
         page_title=f"{COMPANY_NAME} – Danza Aerea",
         page_icon="✨",
         layout="wide",
     )
 
+    assets = st.cache_resource(show_spinner=False)(_bootstrap)()
+    _pattern_cache = assets["patterns"]
+
     # ---- Stili leggeri ----
-    st.markdown(
-        """
-        <style>
-        .stButton>button {border-radius:14px;padding:10px 16px}
-        .card {background: rgba(255,255,255,0.05); border:1px solid rgba(255,255,255,0.12); padding:18px; border-radius:16px}
-        .muted {color: rgba(255,255,255,0.7)}
-        .small {font-size: 0.9rem}
-        .hidden-field {display:none;}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Va emesso a ogni rerun: Streamlit rimuove gli elementi non ri-renderizzati,
+    # quindi iniettarlo solo la prima volta farebbe sparire gli stili.
+    st.markdown(_CSS, unsafe_allow_html=True)
 
     # ---- Header/Hero ----
     st.title("Spettacolo di Danza Aerea")
@@ -102,10 +310,7 @@ def run_streamlit_app(st):
 
     # ---- Galleria ----
     st.subheader("Galleria")
-    cols = st.columns(4)
-    for i, src in enumerate(PHOTOS[:4]):
-        with cols[i % 4]:
-            st.image(src, use_container_width=True, caption=f"Foto {i+1}")
+    st.markdown(assets["gallery_html"], unsafe_allow_html=True)
 
     st.divider()
 
@@ -119,13 +324,7 @@ def run_streamlit_app(st):
     left, right = st.columns([1, 1])
     with left:
         st.subheader("Contatti")
-        st.markdown(
-            f"""
-            **Email:** [{CONTACT_EMAIL}](mailto:{CONTACT_EMAIL})  
-            **Telefono:** [{CONTACT_PHONE}](tel:{CONTACT_PHONE})  
-            **WhatsApp:** [Scrivici](https://wa.me/{WHATSAPP_PHONE})
-            """
-        )
+        st.markdown(assets["contacts_md"])
         st.markdown(
             "- Durata: max 35 minuti\n"
             "- Formato: 2 aerialiste (cerchio + tessuti), un punto aereo\n"
@@ -141,6 +340,27 @@ def run_streamlit_app(st):
         hp = st.text_input("Lascia questo campo vuoto", key="hp")
         st.markdown("<div class='hidden-field'>Campo nascosto anti-spam</div>", unsafe_allow_html=True)
 
+        # Esito degli invii SMTP avviati nei rerun precedenti: terne (body, mailto, Future)
+        pending = []
+        for sent_body, mailto, mail_future in st.session_state.get("mail_futures", []):
+            if not mail_future.done():
+                pending.append((sent_body, mailto, mail_future))
+                continue
+            exc = mail_future.exception()
+            if exc is None:
+                st.toast("Email di richiesta inviata.", icon="✅")
+            else:  # pragma: no cover
+                # L'invio era stato confermato in modo ottimistico: sblocca il nuovo tentativo
+                if st.session_state.get("last_sent") == sent_body:
+                    st.session_state.pop("last_sent", None)
+                st.toast(f"Errore SMTP: {exc}.", icon="⚠️")
+                st.warning(
+                    f"Errore SMTP: {exc}. La richiesta non è stata inviata. Puoi scriverci direttamente "
+                    f"a [{CONTACT_EMAIL}](mailto:{CONTACT_EMAIL}) oppure "
+                    f"[clicca qui per aprire la mail]({mailto})."
+                )
+        st.session_state["mail_futures"] = pending
+
         with st.form("booking_form", clear_on_submit=False):
             ev_date = st.date_input("Data evento *", min_value=date.today(), format="DD/MM/YYYY")
             name = st.text_input("Nome e cognome *")
@@ -183,14 +403,20 @@ def run_streamlit_app(st):
                     "email": email,
                     "location": location,
                     "messaggio": message,
-                    "_subject": f"Richiesta preventivo – {COMPANY_NAME}",
+                    "_subject": _SUBJECT,
                 }
-                sent = False
+                body = _dumps(payload)
+                # Stessa richiesta già inviata in questa sessione (es. doppio click sul
+                # pulsante): niente nuove chiamate di rete.
+                duplicate = st.session_state.get("last_sent") == body
+                sent = duplicate
                 err_msg = None
 
-                if endpoint and requests is not None:
+                # Sessione creata (e `requests` importato) solo quando serve davvero
+                session = st.cache_resource(show_spinner=False)(_make_session)() if not sent and endpoint else None
+                if session is not None:
                     try:
-                        r = requests.post(endpoint, json=payload, timeout=10)
+                        r = session.post(endpoint, data=body, headers=_JSON_HDRS, timeout=10)
                         if r.ok:
                             sent = True
                         else:
@@ -198,52 +424,28 @@ def run_streamlit_app(st):
                     except Exception as e:  # pragma: no cover
                         err_msg = f"Errore invio: {e}"
 
-                # Preferenza 2: SMTP (se secrets presenti)
-                if not sent and all(
-                    k in st.secrets for k in ["EMAIL_HOST", "EMAIL_PORT", "EMAIL_USER", "EMAIL_PASS", "EMAIL_TO"]
-                ):
+                # Preferenza 2: SMTP (se secrets presenti), in background: la conferma è
+                # ottimistica e l'esito reale arriva come toast al rerun successivo.
+                if not sent and _SMTP_KEYS.issubset(st.secrets):
                     try:
-                        import smtplib
-                        from email.mime.text import MIMEText
-
-                        body = (
-                            f"Data evento: {payload['evento_data']}\n"
-                            f"Nome: {payload['nome']}\n"
-                            f"Telefono: {payload['telefono']}\n"
-                            f"Email: {payload['email']}\n"
-                            f"Luogo: {payload['location']}\n"
-                            f"Messaggio: {payload['messaggio']}\n"
+                        cfg = {k: st.secrets[k] for k in _SMTP_KEYS}
+                        # Pool creato solo quando serve davvero, come la sessione HTTP
+                        mail_executor = st.cache_resource(show_spinner=False)(_make_mail_executor)()
+                        st.session_state["mail_futures"].append(
+                            (body, _mailto_link(payload), mail_executor.submit(_send_smtp, payload, cfg))
                         )
-                        msg = MIMEText(body, _charset="utf-8")
-                        msg["Subject"] = payload["_subject"]
-                        msg["From"] = st.secrets["EMAIL_USER"]
-                        msg["To"] = st.secrets["EMAIL_TO"]
-
-                        with smtplib.SMTP_SSL(st.secrets["EMAIL_HOST"], int(st.secrets["EMAIL_PORT"])) as server:
-                            server.login(st.secrets["EMAIL_USER"], st.secrets["EMAIL_PASS"])
-                            server.sendmail(msg["From"], [msg["To"]], msg.as_string())
                         sent = True
                     except Exception as e:  # pragma: no cover
                         err_msg = f"Errore SMTP: {e}"
 
-                if sent:
+                if duplicate:
+                    st.info("Questa richiesta è già stata inviata. Ti risponderemo al più presto.")
+                elif sent:
+                    st.session_state["last_sent"] = body
                     st.success("Richiesta inviata! Ti risponderemo al più presto.")
                     st.balloons()
                 else:
-                    mailto = (
-                        f"mailto:{CONTACT_EMAIL}?subject="
-                        f"Richiesta%20{COMPANY_NAME.replace(' ', '%20')}"
-                        f"&body="
-                        + (
-                            f"Ciao,%0D%0Avorrei prenotare lo spettacolo {COMPANY_NAME}.%0D%0A"
-                            f"Data evento: {payload['evento_data']}%0D%0A"
-                            f"Nome: {payload['nome']}%0D%0A"
-                            f"Telefono: {payload['telefono']}%0D%0A"
-                            f"Email: {payload['email']}%0D%0A"
-                            f"Luogo: {payload['location']}%0D%0A"
-                            f"Messaggio: {payload['messaggio']}"
-                        )
-                    )
+                    mailto = _mailto_link(payload)
                     st.warning(
                         (f"{err_msg} " if err_msg else "")
                         + f"Non sono riuscito a inviare al server. Puoi scriverci direttamente "
@@ -255,67 +457,8 @@ def run_streamlit_app(st):
 
     # ---- Area test (per sviluppatore) ----
     with st.expander("Mostra test di validazione (facoltativo)"):
-        # Test esistenti (INVARIATI)
-        tests = [
-            ("email valida semplice", is_valid_email("mario.rossi@mail.it")),
-            ("email senza dominio", not is_valid_email("mario@")),
-            ("email dominio corto", not is_valid_email("mario@mail")),
-            ("telefono valido IT", is_valid_phone("+39 333 123 4567")),
-            ("telefono troppo corto", not is_valid_phone("123")),
-        ]
-        # Nuovi test AGGIUNTI
-        tests.extend([
-            ("email con subdominio", is_valid_email("mario@sub.mail.it")),
-            ("telefono con parentesi", is_valid_phone("(333) 123-4567")),
-        ])
-
-        # Test logica form (validate-lite)
-        def fmt(d: datetime) -> str:
-            return d.strftime("%Y-%m-%d")
-
-        tomorrow = datetime.now() + timedelta(days=1)
-        yesterday = datetime.now() - timedelta(days=1)
-
-        form_ok = {
-            "name": "Mario Rossi",
-            "email": "ok@mail.it",
-            "phone": "+39 333 123 4567",
-            "date": fmt(tomorrow),
-            "consent": True,
-        }
-        form_no_consent = {**form_ok, "consent": False}
-        form_past = {**form_ok, "date": fmt(yesterday)}
-        form_short_name = {**form_ok, "name": "M"}
-
-        def validate_lite(f: dict) -> dict:
-            e = {}
-            if not f.get("name") or len(f["name"].strip()) < 2:
-                e["name"] = 1
-            if not is_valid_email(f.get("email", "")):
-                e["email"] = 1
-            if not is_valid_phone(f.get("phone", "")):
-                e["phone"] = 1
-            if not f.get("date"):
-                e["date"] = 1
-            else:
-                # Non accettare date nel passato
-                try:
-                    if f["date"] < datetime.now().strftime("%Y-%m-%d"):
-                        e["date"] = 1
-                except Exception:
-                    e["date"] = 1
-            if not f.get("consent"):
-                e["consent"] = 1
-            return e
-
-        tests.extend([
-            ("form valido futuro", len(validate_lite(form_ok)) == 0),
-            ("form consenso mancante", "consent" in validate_lite(form_no_consent)),
-            ("form data passata", "date" in validate_lite(form_past)),
-            ("form nome troppo corto", "name" in validate_lite(form_short_name)),
-        ])
-
-        passed = sum(1 for _, ok in tests if ok)
+        tests = _run_tests()
+        passed = sum(map(itemgetter(1), tests))
         st.write(f"Passati {passed}/{len(tests)}")
         st.table({"test": [t[0] for t in tests], "ok": ["✔" if t[1] else "✘" for t in tests]})
 
@@ -328,62 +471,10 @@ def run_streamlit_app(st):
 
 def run_cli_mode():
     print("Streamlit non disponibile: eseguo test CLI di validazione…")
-    tests = [
-        ("email valida semplice", is_valid_email("mario.rossi@mail.it")),
-        ("email senza dominio", not is_valid_email("mario@")),
-        ("email dominio corto", not is_valid_email("mario@mail")),
-        ("telefono valido IT", is_valid_phone("+39 333 123 4567")),
-        ("telefono troppo corto", not is_valid_phone("123")),
-        ("email con subdominio", is_valid_email("mario@sub.mail.it")),
-        ("telefono con parentesi", is_valid_phone("(333) 123-4567")),
-    ]
-
-    def fmt(d: datetime) -> str:
-        return d.strftime("%Y-%m-%d")
-
-    tomorrow = datetime.now() + timedelta(days=1)
-    yesterday = datetime.now() - timedelta(days=1)
-
-    form_ok = {
-        "name": "Mario Rossi",
-        "email": "ok@mail.it",
-        "phone": "+39 333 123 4567",
-        "date": fmt(tomorrow),
-        "consent": True,
-    }
-    form_no_consent = {**form_ok, "consent": False}
-    form_past = {**form_ok, "date": fmt(yesterday)}
-    form_short_name = {**form_ok, "name": "M"}
-
-    def validate_lite(f: dict) -> dict:
-        e = {}
-        if not f.get("name") or len(f["name"].strip()) < 2:
-            e["name"] = 1
-        if not is_valid_email(f.get("email", "")):
-            e["email"] = 1
-        if not is_valid_phone(f.get("phone", "")):
-            e["phone"] = 1
-        if not f.get("date"):
-            e["date"] = 1
-        else:
-            try:
-                if f["date"] < datetime.now().strftime("%Y-%m-%d"):
-                    e["date"] = 1
-            except Exception:
-                e["date"] = 1
-        if not f.get("consent"):
-            e["consent"] = 1
-        return e
-
-    tests.extend([
-        ("form valido futuro", len(validate_lite(form_ok)) == 0),
-        ("form consenso mancante", "consent" in validate_lite(form_no_consent)),
-        ("form data passata", "date" in validate_lite(form_past)),
-        ("form nome troppo corto", "name" in validate_lite(form_short_name)),
-    ])
+    tests = _run_tests()
 
     # Stampa risultati
-    passed = sum(1 for _, ok in tests if ok)
+    passed = sum(map(itemgetter(1), tests))
     print(f"Passati {passed}/{len(tests)} test")
     for name, ok in tests:
         print(f"{'✔' if ok else '✘'} {name}")